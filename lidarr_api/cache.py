@@ -0,0 +1,89 @@
+"""
+Response caching for the Lidarr API Python client.
+
+This module provides the `ETagCache` class, a small persistent store of
+``(etag, body)`` pairs keyed by request URL. The client uses it to issue
+conditional GET requests so unchanged resources come back as an empty
+``304 Not Modified`` instead of a full JSON body.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+DEFAULT_ETAG_CACHE_PATH = os.path.expanduser("~/.cache/lidarr-api/etag.db")
+
+
+class ETagCache:
+    """
+    Persistent ETag cache backed by SQLite.
+
+    The cache is safe to share between threads. Once opened, storage errors are
+    treated as cache misses so a broken cache file never breaks API requests.
+
+    Args:
+        cache_path: Path to the cache database. Defaults to ~/.cache/lidarr-api/etag.db
+
+    Example:
+        >>> cache = ETagCache()
+        >>> cache.set('http://localhost:8686/api/v1/qualityprofile', '"abc"', '[]')
+        >>> cache.get('http://localhost:8686/api/v1/qualityprofile')
+        ('"abc"', '[]')
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the ETag cache.
+
+        Args:
+            cache_path: Optional path to the cache database. If not provided,
+                       defaults to ~/.cache/lidarr-api/etag.db
+
+        Raises:
+            OSError: If the cache directory can't be created
+            sqlite3.Error: If the cache database can't be opened
+        """
+        self.cache_path = cache_path or DEFAULT_ETAG_CACHE_PATH
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS etag "
+                    "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL)"
+                )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Get the cached ``(etag, body)`` pair for a URL."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, body FROM etag WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], row[1]) if row else None
+
+    def set(self, url: str, etag: str, body: str) -> None:
+        """Store the ETag and raw response body for a URL."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO etag (url, etag, body) VALUES (?, ?, ?)",
+                    (url, etag, body)
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
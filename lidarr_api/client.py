@@ -1,6 +1,9 @@
 """Lidarr API client module for interacting with Lidarr instances."""
 
+import json
 import logging
+import sqlite3
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -8,6 +11,12 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .cache import ETagCache
+
+# Endpoints whose responses rarely change and are fetched with conditional GETs
+# when an ETag cache is configured.
+ETAG_ENDPOINTS = frozenset({'qualityprofile', 'metadataprofile', 'importlist'})
+
 
 class LidarrClient:
     """
@@ -24,7 +33,10 @@ class LidarrClient:
                  retry_total: int = 3,
                  retry_backoff_factor: float = 0.3,
                  timeout: int = 60,  # Increased default timeout
-                 rate_limit_per_second: float = 2.0):
+                 rate_limit_per_second: float = 2.0,
+                 etag_cache_path: Optional[str] = None,
+                 pool_connections: int = 4,
+                 pool_maxsize: int = 16):
         """
         Initialize the Lidarr API client.
 
@@ -42,6 +54,13 @@ class LidarrClient:
             timeout: Request timeout in seconds (default: 60)
             rate_limit_per_second: Maximum number of requests per second (default: 2.0)
                 This helps prevent overwhelming the Lidarr server
+            etag_cache_path: Path to a persistent ETag cache (default: None, disabled)
+                When set, profile and import list requests send If-None-Match and
+                reuse the cached body on a 304 Not Modified response. If the cache
+                can't be opened, requests are made without it
+            pool_connections: Number of host connection pools to cache (default: 4)
+            pool_maxsize: Maximum keep-alive connections per pool (default: 16)
+                Should be at least the number of threads sharing the client
 
         Example:
             >>> client = LidarrClient(
@@ -56,6 +75,7 @@ class LidarrClient:
         self.timeout = timeout
         self.rate_limit = 1.0 / rate_limit_per_second
         self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
 
         # Set up logging
         self.logger = logging.getLogger('lidarr_api')
@@ -67,7 +87,16 @@ class LidarrClient:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
 
-        # Set up session with retries
+        # A cache that can't be opened (e.g. unwritable ~/.cache) only disables caching
+        self.etag_cache = None
+        if etag_cache_path:
+            try:
+                self.etag_cache = ETagCache(etag_cache_path)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning("ETag cache disabled, cannot open %s: %s",
+                                    etag_cache_path, e)
+
+        # Set up a single keep-alive session with retries, reused for all requests
         self.session = requests.Session()
         retry_strategy = Retry(
             total=retry_total,
@@ -77,7 +106,11 @@ class LidarrClient:
                              "DELETE", "OPTIONS", "TRACE", "POST"],
             raise_on_status=True
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -88,14 +121,17 @@ class LidarrClient:
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         """Make a request to the Lidarr API with rate limiting."""
-        # Apply rate limiting
-        now = time.time()
-        time_since_last_request = now - self.last_request_time
-        if time_since_last_request < self.rate_limit:
-            sleep_time = self.rate_limit - time_since_last_request
-            self.logger.debug(
-                "Rate limiting - sleeping for %.2fs", sleep_time)
-            time.sleep(sleep_time)
+        # Apply rate limiting. The lock keeps concurrent callers (e.g. scripts
+        # using a thread pool) from all observing the same last request time.
+        with self._rate_limit_lock:
+            now = time.time()
+            time_since_last_request = now - self.last_request_time
+            if time_since_last_request < self.rate_limit:
+                sleep_time = self.rate_limit - time_since_last_request
+                self.logger.debug(
+                    "Rate limiting - sleeping for %.2fs", sleep_time)
+                time.sleep(sleep_time)
+            self.last_request_time = time.time()
 
         url = f"{self.base_url}/api/v1/{endpoint}"
         self.logger.debug("Making %s request to %s", method, url)
@@ -103,10 +139,24 @@ class LidarrClient:
         # Add timeout to all requests
         kwargs['timeout'] = kwargs.get('timeout', self.timeout)
 
+        cached = None
+        use_etag = (self.etag_cache is not None and method == 'GET'
+                    and endpoint in ETAG_ENDPOINTS)
+        if use_etag:
+            cached = self.etag_cache.get(url)
+            if cached:
+                kwargs['headers'] = {**kwargs.get('headers', {}), 'If-None-Match': cached[0]}
+
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-            self.last_request_time = time.time()
+            if use_etag:
+                if response.status_code == 304 and cached:
+                    self.logger.debug("Using cached response for %s", url)
+                    return json.loads(cached[1])
+                etag = response.headers.get('ETag')
+                if etag and response.content:
+                    self.etag_cache.set(url, etag, response.text)
             return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
             self.logger.error("Request failed: %s", str(e))
@@ -235,14 +285,25 @@ class LidarrClient:
         page: int = 1,
         page_size: int = 10,
         include_artist: bool = True,
-        include_album: bool = True
+        include_album: bool = True,
+        include_unknown_artist_items: bool = False
     ) -> Dict[str, Any]:
-        """Get the current download queue."""
+        """
+        Get the current download queue.
+
+        Args:
+            page: Page number to return
+            page_size: Number of items per page
+            include_artist: Whether to include artist information
+            include_album: Whether to include album information
+            include_unknown_artist_items: Whether to include items not matched to an artist
+        """
         params = {
             'page': page,
             'pageSize': page_size,
             'includeArtist': self._bool_to_str(include_artist),
-            'includeAlbum': self._bool_to_str(include_album)
+            'includeAlbum': self._bool_to_str(include_album),
+            'includeUnknownArtistItems': self._bool_to_str(include_unknown_artist_items)
         }
         return self._request('GET', 'queue', params=params)
 
@@ -270,14 +331,29 @@ class LidarrClient:
         self,
         page: int = 1,
         page_size: int = 10,
-        include_artist: bool = True
+        include_artist: bool = True,
+        sort_key: Optional[str] = None,
+        sort_direction: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get download history."""
+        """
+        Get download history.
+
+        Args:
+            page: Page number to return
+            page_size: Number of items per page
+            include_artist: Whether to include artist information
+            sort_key: Field to sort by (e.g. 'date')
+            sort_direction: 'ascending' or 'descending'
+        """
         params = {
             'page': page,
             'pageSize': page_size,
             'includeArtist': self._bool_to_str(include_artist)
         }
+        if sort_key:
+            params['sortKey'] = sort_key
+        if sort_direction:
+            params['sortDirection'] = sort_direction
         return self._request('GET', 'history', params=params)
 
     def get_disk_space(self) -> List[Dict[str, Any]]:
@@ -9,22 +9,50 @@ This script provides library management functionality for Lidarr:
 - Queue management and monitoring
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lidarr_api import LidarrClient
+
+# Row templates for table output
+_WANTED_ROW = "%-30s %-40s %-12s %-15s"
+_QUALITY_PROFILE_ROW = "%-5s %-30s %-20s %-10s"
+_METADATA_PROFILE_ROW = "%-5s %-30s"
+_IMPORT_LIST_ROW = "%-5s %-30s %-20s %-10s"
+_QUEUE_ROW = "%-25s %-35s %-15s %-10s %-12s"
 
-from lidarr_api import LidarrClient
-from lidarr_api.config import Config
+
+def _positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def setup_client(args: argparse.Namespace) -> LidarrClient:
     """Set up the Lidarr client from arguments or config."""
+    # Imported here so --help and argument errors don't pay for loading requests
+    from lidarr_api import LidarrClient  # pylint: disable=import-outside-toplevel
+    from lidarr_api.cache import DEFAULT_ETAG_CACHE_PATH  # pylint: disable=import-outside-toplevel
+    from lidarr_api.config import Config  # pylint: disable=import-outside-toplevel
+
     if args.url and args.api_key:
         client = LidarrClient(
             base_url=args.url,
             api_key=args.api_key,
             timeout=args.timeout,
             retry_total=args.retries,
+            etag_cache_path=DEFAULT_ETAG_CACHE_PATH,
         )
     else:
         config = Config(args.config)
@@ -35,11 +63,21 @@ def setup_client(args: argparse.Namespace) -> LidarrClient:
                 "or save settings first."
             )
             sys.exit(1)
-        client = LidarrClient(**settings, timeout=args.timeout, retry_total=args.retries)
+        client = LidarrClient(
+            **settings,
+            timeout=args.timeout,
+            retry_total=args.retries,
+            etag_cache_path=DEFAULT_ETAG_CACHE_PATH,
+        )
 
     return client
 
 
+def _trunc(text: str, width: int) -> str:
+    """Truncate text to at most width characters, ending with an ellipsis."""
+    return text if len(text) <= width else text[:width - 1] + '…'
+
+
 def list_wanted_albums(
     client: LidarrClient,
     page: int = 1,
@@ -63,7 +101,7 @@ def list_wanted_albums(
             return
 
         print(f"Wanted Albums (Page {page}, showing {len(records)} of {total_records} total):")
-        print(f"{'Artist':<30} {'Album':<40} {'Release Date':<12} {'Status':<15}")
+        print(_WANTED_ROW % ('Artist', 'Album', 'Release Date', 'Status'))
         print("-" * 100)
 
         for album in records:
@@ -77,10 +115,8 @@ def list_wanted_albums(
             status = "Monitored" if monitored else "Unmonitored"
 
             # Truncate long names
-            if len(artist_name) > 28:
-                artist_name = artist_name[:25] + "..."
-            if len(album_title) > 38:
-                album_title = album_title[:35] + "..."
+            artist_name = _trunc(artist_name, 28)
+            album_title = _trunc(album_title, 38)
 
             # Format date
             if release_date != 'Unknown':
@@ -90,7 +126,7 @@ def list_wanted_albums(
                 except ValueError:
                     pass
 
-            print(f"{artist_name:<30} {album_title:<40} {release_date:<12} {status:<15}")
+            print(_WANTED_ROW % (artist_name, album_title, release_date, status))
 
         # Show pagination info
         total_pages = (total_records + page_size - 1) // page_size
@@ -147,7 +183,7 @@ def list_quality_profiles(client: LidarrClient) -> None:
             return
 
         print("Quality Profiles:")
-        print(f"{'ID':<5} {'Name':<30} {'Cutoff':<20} {'Items':<10}")
+        print(_QUALITY_PROFILE_ROW % ('ID', 'Name', 'Cutoff', 'Items'))
         print("-" * 70)
 
         for profile in profiles:
@@ -159,7 +195,7 @@ def list_quality_profiles(client: LidarrClient) -> None:
             )
             items_count = len(profile.get('items', []))
 
-            print(f"{profile_id:<5} {name:<30} {cutoff:<20} {items_count:<10}")
+            print(_QUALITY_PROFILE_ROW % (profile_id, name, cutoff, items_count))
 
         print(f"\nTotal: {len(profiles)} profiles")
 
@@ -179,14 +215,14 @@ def list_metadata_profiles(client: LidarrClient) -> None:
             return
 
         print("Metadata Profiles:")
-        print(f"{'ID':<5} {'Name':<30}")
+        print(_METADATA_PROFILE_ROW % ('ID', 'Name'))
         print("-" * 40)
 
         for profile in profiles:
             profile_id = profile.get('id', 'N/A')
             name = profile.get('name', 'Unknown')
 
-            print(f"{profile_id:<5} {name:<30}")
+            print(_METADATA_PROFILE_ROW % (profile_id, name))
 
         print(f"\nTotal: {len(profiles)} profiles")
 
@@ -206,7 +242,7 @@ def list_import_lists(client: LidarrClient) -> None:
             return
 
         print("Import Lists:")
-        print(f"{'ID':<5} {'Name':<30} {'Type':<20} {'Enabled':<10}")
+        print(_IMPORT_LIST_ROW % ('ID', 'Name', 'Type', 'Enabled'))
         print("-" * 70)
 
         for import_list in lists:
@@ -215,7 +251,7 @@ def list_import_lists(client: LidarrClient) -> None:
             implementation = import_list.get('implementation', 'Unknown')
             enabled = "Yes" if import_list.get('enabled', False) else "No"
 
-            print(f"{list_id:<5} {name:<30} {implementation:<20} {enabled:<10}")
+            print(_IMPORT_LIST_ROW % (list_id, name, implementation, enabled))
 
         print(f"\nTotal: {len(lists)} import lists")
 
@@ -241,6 +277,48 @@ def test_import_list(client: LidarrClient, list_id: int) -> None:
         print(f"Error testing import list: {e}")
 
 
+def test_all_import_lists(client: LidarrClient, max_workers: int = 8) -> None:
+    """
+    Test every configured import list concurrently and summarize the results.
+
+    The client's rate limiter still spaces out request starts, so extra workers
+    only help when a single list test takes longer than the rate limit interval.
+    """
+    try:
+        lists = client.get_import_lists()
+        list_ids = [import_list['id'] for import_list in lists if 'id' in import_list]
+
+        if not list_ids:
+            print("No import lists configured")
+            return
+
+        print(f"Testing {len(list_ids)} import lists...")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(list_ids))) as executor:
+            futures = [(list_id, executor.submit(client.test_import_list, list_id))
+                       for list_id in list_ids]
+
+            failed = 0
+            for list_id, future in futures:
+                try:
+                    result = future.result() or {}
+                except Exception as e:  # pylint: disable=broad-except
+                    failed += 1
+                    print(f"{list_id}: FAIL ({e})")
+                    continue
+
+                if result.get('isValid', False):
+                    print(f"{list_id}: OK")
+                else:
+                    failed += 1
+                    errors = len(result.get('validationFailures') or ())
+                    print(f"{list_id}: FAIL ({errors} errors)")
+
+        print(f"\n{len(list_ids) - failed} of {len(list_ids)} import lists passed")
+
+    except (KeyError, ValueError, ImportError) as e:
+        print(f"Error testing import lists: {e}")
+
+
 def view_queue(
     client: LidarrClient,
     page: int = 1,
@@ -265,7 +343,7 @@ def view_queue(
         print(
             f"Download Queue (Page {page}, showing {len(records)} of {total_records} total items):"
         )
-        print(f"{'Artist':<25} {'Album':<35} {'Status':<15} {'Progress':<10} {'Time Left':<12}")
+        print(_QUEUE_ROW % ('Artist', 'Album', 'Status', 'Progress', 'Time Left'))
         print("-" * 110)
 
         for item in records:
@@ -283,10 +361,8 @@ def view_queue(
             time_left = item.get('timeleft', 'Unknown')
 
             # Truncate long names
-            if len(artist_name) > 23:
-                artist_name = artist_name[:20] + "..."
-            if len(album_title) > 33:
-                album_title = album_title[:30] + "..."
+            artist_name = _trunc(artist_name, 23)
+            album_title = _trunc(album_title, 33)
 
             # Calculate progress percentage
             if size > 0 and progress >= 0:
@@ -304,10 +380,7 @@ def view_queue(
                 except (TypeError, ValueError):
                     pass
 
-            print(
-                f"{artist_name:<25} {album_title:<35} {status:<15} "
-                f"{progress_str:<10} {str(time_left):<12}"
-            )
+            print(_QUEUE_ROW % (artist_name, album_title, status, progress_str, time_left))
 
         # Show pagination info
         total_pages = (total_records + page_size - 1) // page_size
@@ -366,6 +439,9 @@ Examples:
   # Test import list
   %(prog)s imports test --id 1
 
+  # Test all import lists
+  %(prog)s imports testall
+
   # View download queue
   %(prog)s queue view
 
@@ -423,6 +499,16 @@ Examples:
     test_imports_parser = imports_subparsers.add_parser('test', help='Test import list')
     test_imports_parser.add_argument('--id', type=int, required=True, help='Import list ID')
 
+    testall_imports_parser = imports_subparsers.add_parser(
+        'testall', help='Test all import lists'
+    )
+    testall_imports_parser.add_argument(
+        '--workers', type=_positive_int, default=8,
+        help='Concurrent tests (default: 8). Tests still start at most 2 per second '
+             'because of the client rate limit, so more workers only help when a '
+             'list test takes longer than 0.5s'
+    )
+
     # Queue commands
     queue_parser = subparsers.add_parser('queue', help='Download queue management')
     queue_subparsers = queue_parser.add_subparsers(dest='queue_command', help='Queue commands')
@@ -477,6 +563,8 @@ Examples:
                 list_import_lists(client)
             elif args.imports_command == 'test':
                 test_import_list(client, args.id)
+            elif args.imports_command == 'testall':
+                test_all_import_lists(client, args.workers)
             else:
                 imports_parser.print_help()
                 return 1
@@ -11,19 +11,51 @@ This script provides monitoring and health check functionality for Lidarr:
 - Health check with configurable alerts
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import json
+import math
+import os
+import signal
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from lidarr_api import LidarrClient
+
+ACTIVE_STATUSES = frozenset({"downloading", "queued"})
+FAILED_STATUSES = frozenset({"failed", "warning"})
+UTC = timezone.utc
+
+# Errors a single check can recover from. requests exceptions derive from OSError
+# (not the builtin ConnectionError) and invalid JSON raises ValueError.
+REQUEST_ERRORS = (OSError, ValueError, KeyError)
 
-from lidarr_api import LidarrClient
-from lidarr_api.config import Config
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+QUEUE_PAGE_SIZE = 100
+HISTORY_PAGE_SIZE = 100
+
+TTL_CACHE_PATH = os.path.expanduser("~/.cache/lidarr-api/ttl.json")
+
+# Maps "<base url>|<helper name>" to [expiry timestamp, cached value]
+_TTL_CACHE: Dict[str, List[Any]] = {}
+_ttl_cache_loaded = False
 
 
 def setup_client(args: argparse.Namespace) -> LidarrClient:
     """Set up the Lidarr client from arguments or config."""
+    # Imported here so --help and argument errors don't pay for loading requests
+    from lidarr_api import LidarrClient  # pylint: disable=import-outside-toplevel
+    from lidarr_api.config import Config  # pylint: disable=import-outside-toplevel
+
     if args.url and args.api_key:
         client = LidarrClient(
             base_url=args.url,
@@ -47,45 +79,109 @@ def setup_client(args: argparse.Namespace) -> LidarrClient:
     return client
 
 
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting the trailing 'Z' Lidarr uses."""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
 def format_bytes(bytes_val: float) -> str:
     """Format bytes into human readable format."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.1f} PB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    unit = min((int(bytes_val).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_val / (1 << (10 * unit)):.1f} {_BYTE_UNITS[unit]}"
 
 
 def format_duration(seconds: int) -> str:
     """Format seconds into human readable duration."""
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{seconds // 60}m {seconds % 60}s"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if days:
         return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
+
+
+def _classify_queue(
+    queue_items: List[Dict[str, Any]]
+) -> Tuple[int, int, int, List[Dict[str, Any]]]:
+    """
+    Count active, failed and stalled queue items in a single pass.
+
+    Returns:
+        Tuple of (active count, failed count, stalled count, failed items)
+    """
+    active = stalled = 0
+    failed_items = []
+    for item in queue_items:
+        status = item.get("status")
+        if status in ACTIVE_STATUSES:
+            active += 1
+        elif status in FAILED_STATUSES:
+            failed_items.append(item)
+        elif status == "delay":
+            stalled += 1
+    return active, len(failed_items), stalled, failed_items
+
+
+def _fetch_queue_records(
+    client: LidarrClient, **kwargs: Any
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Fetch every queue record, requesting the pages after the first concurrently.
+
+    Returns:
+        Tuple of (records, total record count reported by Lidarr)
+    """
+    first_page = client.get_queue(page=1, page_size=QUEUE_PAGE_SIZE, **kwargs)
+    records = list(first_page.get("records", []))
+    total_records = first_page.get("totalRecords", 0)
+
+    pages = math.ceil(total_records / QUEUE_PAGE_SIZE)
+    if pages > 1:
+        with ThreadPoolExecutor(max_workers=min(pages - 1, 8)) as executor:
+            futures = [
+                executor.submit(client.get_queue, page=page, page_size=QUEUE_PAGE_SIZE, **kwargs)
+                for page in range(2, pages + 1)
+            ]
+            for future in futures:
+                records.extend(future.result().get("records", []))
 
+    return records, total_records
 
-def system_status_check(client: LidarrClient, verbose: bool = False) -> Dict[str, Any]:
-    """Perform comprehensive system status check."""
-    results = {
-        "timestamp": datetime.now().isoformat(),
-        "status": "healthy",
+
+# Severity order used when merging the status of individual checks
+_STATUS_SEVERITY = {"healthy": 0, "warning": 1, "error": 2}
+
+
+def _new_check_result() -> Dict[str, Any]:
+    """Create an empty partial result for a single health check."""
+    return {
         "checks": {},
         "warnings": [],
         "errors": [],
+        "status": "healthy",
+        "output": [],
     }
 
+
+def _check_system(client: LidarrClient) -> Dict[str, Any]:
+    """Check basic system status and uptime."""
+    result = _new_check_result()
+
     try:
-        # Basic system status
         status = client.get_system_status()
-        results["checks"]["system_info"] = {
+        result["checks"]["system_info"] = {
             "version": status.get("version"),
             "build_time": status.get("buildTime"),
             "start_time": status.get("startTime"),
@@ -96,30 +192,32 @@ def system_status_check(client: LidarrClient, verbose: bool = False) -> Dict[str
         # Calculate uptime
         if status.get("startTime"):
             try:
-                start_time = datetime.fromisoformat(
-                    status["startTime"].replace("Z", "+00:00")
-                )
-                uptime_seconds = (
-                    datetime.now().replace(tzinfo=start_time.tzinfo) - start_time
-                ).total_seconds()
-                results["checks"]["uptime"] = format_duration(int(uptime_seconds))
-            except (ValueError, TypeError, KeyError):
-                results["checks"]["uptime"] = "Unknown"
+                start_time = _parse_iso(status["startTime"])
+                if start_time.tzinfo is None:
+                    start_time = start_time.replace(tzinfo=UTC)
+                uptime_seconds = (datetime.now(tz=UTC) - start_time).total_seconds()
+                result["checks"]["uptime"] = format_duration(int(uptime_seconds))
+            except (ValueError, TypeError, AttributeError, KeyError):
+                result["checks"]["uptime"] = "Unknown"
 
-        if verbose:
-            print(f"✓ Lidarr {status.get('version')} is running")
-            print(f"  Uptime: {results['checks'].get('uptime', 'Unknown')}")
+        result["output"].append(f"✓ Lidarr {status.get('version')} is running")
+        result["output"].append(f"  Uptime: {result['checks'].get('uptime', 'Unknown')}")
 
-    except (ConnectionError, ValueError, KeyError) as e:
-        results["errors"].append(f"Failed to get system status: {e}")
-        results["status"] = "error"
-        if verbose:
-            print(f"✗ Failed to get system status: {e}")
+    except REQUEST_ERRORS as e:
+        result["errors"].append(f"Failed to get system status: {e}")
+        result["status"] = "error"
+        result["output"].append(f"✗ Failed to get system status: {e}")
+
+    return result
+
+
+def _check_disk(client: LidarrClient) -> Dict[str, Any]:
+    """Check free disk space on all root folders."""
+    result = _new_check_result()
 
     try:
-        # Disk space check
         disk_space = client.get_disk_space()
-        results["checks"]["disk_space"] = []
+        result["checks"]["disk_space"] = []
 
         for disk in disk_space:
             path = disk.get("path", "Unknown")
@@ -137,63 +235,54 @@ def system_status_check(client: LidarrClient, verbose: bool = False) -> Dict[str
                     "total_gb": round(total_gb, 1),
                     "used_percent": round(used_percent, 1),
                 }
-                results["checks"]["disk_space"].append(disk_info)
+                result["checks"]["disk_space"].append(disk_info)
 
                 # Check for low disk space
                 if used_percent > 90:
-                    results["errors"].append(
+                    result["errors"].append(
                         f"Critical: Disk {path} is {used_percent:.1f}% full"
                     )
-                    results["status"] = "error"
+                    result["status"] = "error"
                 elif used_percent > 80:
-                    results["warnings"].append(
+                    result["warnings"].append(
                         f"Warning: Disk {path} is {used_percent:.1f}% full"
                     )
-                    if results["status"] == "healthy":
-                        results["status"] = "warning"
+                    if result["status"] == "healthy":
+                        result["status"] = "warning"
 
-                if verbose:
-                    status_icon = (
-                        "✗" if used_percent > 90 else "⚠" if used_percent > 80 else "✓"
-                    )
-                    print(
-                        f"{status_icon} Disk {path}: {free_gb:.1f} GB free of "
-                        f"{total_gb:.1f} GB ({used_percent:.1f}% used)"
-                    )
+                status_icon = (
+                    "✗" if used_percent > 90 else "⚠" if used_percent > 80 else "✓"
+                )
+                result["output"].append(
+                    f"{status_icon} Disk {path}: {free_gb:.1f} GB free of "
+                    f"{total_gb:.1f} GB ({used_percent:.1f}% used)"
+                )
 
-    except (OSError, ValueError) as e:
-        results["errors"].append(f"Failed to check disk space: {e}")
-        if results["status"] != "error":
-            results["status"] = "warning"
-        if verbose:
-            print(f"⚠ Failed to check disk space: {e}")
+    except REQUEST_ERRORS as e:
+        result["errors"].append(f"Failed to check disk space: {e}")
+        if result["status"] != "error":
+            result["status"] = "warning"
+        result["output"].append(f"⚠ Failed to check disk space: {e}")
+
+    return result
+
+
+def _check_queue(client: LidarrClient) -> Dict[str, Any]:
+    """Check the download queue for failed and stalled items."""
+    result = _new_check_result()
 
     try:
-        # Queue status check
-        queue_result = client.get_queue(page=1, page_size=100)
-        queue_items = queue_result.get("records", [])
-        total_queue = queue_result.get("totalRecords", 0)
+        # Only statuses are needed, so skip the per-item artist and album payload
+        queue_items, total_queue = _fetch_queue_records(
+            client, include_artist=False, include_album=False
+        )
 
         # Analyze queue
-        active_downloads = len(
-            [
-                item
-                for item in queue_items
-                if item.get("status") in ["downloading", "queued"]
-            ]
-        )
-        failed_downloads = len(
-            [
-                item
-                for item in queue_items
-                if item.get("status") in ["failed", "warning"]
-            ]
-        )
-        stalled_downloads = len(
-            [item for item in queue_items if item.get("status") == "delay"]
+        active_downloads, failed_downloads, stalled_downloads, _ = _classify_queue(
+            queue_items
         )
 
-        results["checks"]["queue"] = {
+        result["checks"]["queue"] = {
             "total_items": total_queue,
             "active_downloads": active_downloads,
             "failed_downloads": failed_downloads,
@@ -201,52 +290,104 @@ def system_status_check(client: LidarrClient, verbose: bool = False) -> Dict[str
         }
 
         if failed_downloads > 0:
-            results["warnings"].append(
+            result["warnings"].append(
                 f"Warning: {failed_downloads} failed downloads in queue"
             )
-            if results["status"] == "healthy":
-                results["status"] = "warning"
+            result["status"] = "warning"
 
         if stalled_downloads > 5:
-            results["warnings"].append(
+            result["warnings"].append(
                 f"Warning: {stalled_downloads} stalled downloads"
             )
-            if results["status"] == "healthy":
-                results["status"] = "warning"
+            result["status"] = "warning"
 
-        if verbose:
-            status_icon = "⚠" if failed_downloads > 0 or stalled_downloads > 5 else "✓"
-            print(
-                f"{status_icon} Queue: {total_queue} total, {active_downloads} active, "
-                f"{failed_downloads} failed, {stalled_downloads} stalled"
-            )
+        status_icon = "⚠" if failed_downloads > 0 or stalled_downloads > 5 else "✓"
+        result["output"].append(
+            f"{status_icon} Queue: {total_queue} total, {active_downloads} active, "
+            f"{failed_downloads} failed, {stalled_downloads} stalled"
+        )
 
-    except (ConnectionError, ValueError, KeyError) as e:
-        results["errors"].append(f"Failed to check queue: {e}")
-        if results["status"] != "error":
-            results["status"] = "warning"
-        if verbose:
-            print(f"⚠ Failed to check queue: {e}")
+    except REQUEST_ERRORS as e:
+        result["errors"].append(f"Failed to check queue: {e}")
+        result["status"] = "warning"
+        result["output"].append(f"⚠ Failed to check queue: {e}")
+
+    return result
+
+
+def _check_wanted(client: LidarrClient) -> Dict[str, Any]:
+    """Check the number of wanted albums."""
+    result = _new_check_result()
 
     try:
-        # Wanted albums check
         wanted_result = client.get_wanted(page=1, page_size=1)
         total_wanted = wanted_result.get("totalRecords", 0)
-        results["checks"]["wanted_albums"] = total_wanted
+        result["checks"]["wanted_albums"] = total_wanted
+        result["output"].append(f"ℹ Wanted albums: {total_wanted}")
 
-        if verbose:
-            print(f"ℹ Wanted albums: {total_wanted}")
+    except REQUEST_ERRORS as e:
+        result["warnings"].append(f"Failed to check wanted albums: {e}")
+        result["status"] = "warning"
+        result["output"].append(f"⚠ Failed to check wanted albums: {e}")
+
+    return result
 
-    except (ConnectionError, ValueError, KeyError) as e:
-        results["warnings"].append(f"Failed to check wanted albums: {e}")
-        if results["status"] == "healthy":
-            results["status"] = "warning"
+
+def system_status_check(client: LidarrClient, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Perform comprehensive system status check.
+
+    The individual checks are independent requests, so they run concurrently and
+    the total latency is that of the slowest check. Results and verbose output
+    are merged in a fixed order once all checks have finished.
+    """
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "status": "healthy",
+        "checks": {},
+        "warnings": [],
+        "errors": [],
+    }
+
+    checks = (_check_system, _check_disk, _check_queue, _check_wanted)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check, client) for check in checks]
+        partials = [future.result() for future in futures]
+
+    for partial in partials:
+        results["checks"].update(partial["checks"])
+        results["warnings"].extend(partial["warnings"])
+        results["errors"].extend(partial["errors"])
+        if _STATUS_SEVERITY[partial["status"]] > _STATUS_SEVERITY[results["status"]]:
+            results["status"] = partial["status"]
         if verbose:
-            print(f"⚠ Failed to check wanted albums: {e}")
+            for line in partial["output"]:
+                print(line)
 
     return results
 
 
+def _describe_failed_items(
+    client: LidarrClient, failed_items: List[Dict[str, Any]]
+) -> List[str]:
+    """Format alert lines for failed queue items, looking up each album once."""
+    albums: Dict[Any, Dict[str, Any]] = {}
+    lines = []
+    for item in failed_items:
+        album_id = item.get("albumId")
+        if album_id is not None and album_id not in albums:
+            try:
+                albums[album_id] = client.get_album(album_id) or {}
+            except REQUEST_ERRORS:
+                albums[album_id] = {}
+        album = albums.get(album_id, {})
+        artist = (album.get("artist") or {}).get("artistName", "Unknown")
+        title = album.get("title", "Unknown")
+        error_message = item.get("errorMessage", "No error message")
+        lines.append(f"  ✗ {artist} - {title}: {error_message}")
+    return lines
+
+
 def monitor_queue_continuously(
     client: LidarrClient, interval: int = 60, max_failed: int = 10
 ) -> None:
@@ -255,61 +396,45 @@ def monitor_queue_continuously(
     print(f"Will alert if failed downloads exceed {max_failed}")
     print("Press Ctrl+C to stop...")
 
+    # SIGTERM (e.g. from systemd) ends the wait between polls immediately
+    stop_event = threading.Event()
+    previous_handler = None
     try:
-        while True:
+        previous_handler = signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    except ValueError:
+        # Signal handlers can only be installed from the main thread
+        pass
+
+    try:
+        while not stop_event.is_set():
             try:
-                queue_result = client.get_queue(page=1, page_size=100)
-                queue_items = queue_result.get("records", [])
-                total_queue = queue_result.get("totalRecords", 0)
-
-                active_downloads = len(
-                    [
-                        item
-                        for item in queue_items
-                        if item.get("status") in ["downloading", "queued"]
-                    ]
-                )
-                failed_downloads = len(
-                    [
-                        item
-                        for item in queue_items
-                        if item.get("status") in ["failed", "warning"]
-                    ]
-                )
-                stalled_downloads = len(
-                    [item for item in queue_items if item.get("status") == "delay"]
+                # Poll without artist/album details; alerts look up names for a few failed items
+                queue_items, total_queue = _fetch_queue_records(
+                    client, include_artist=False, include_album=False
                 )
 
+                (
+                    active_downloads, failed_downloads, stalled_downloads, failed_items
+                ) = _classify_queue(queue_items)
+
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
                 if failed_downloads > max_failed:
-                    print(
+                    alert_lines = [
                         f"🚨 ALERT [{timestamp}]: {failed_downloads} failed downloads "
                         f"(threshold: {max_failed})"
-                    )
-
-                    # Show details of failed downloads
-                    failed_items = [
-                        item
-                        for item in queue_items
-                        if item.get("status") in ["failed", "warning"]
                     ]
-                    for item in failed_items[:5]:  # Show first 5
-                        artist = (
-                            item.get("artist", {}).get("artistName", "Unknown")
-                            if item.get("artist")
-                            else "Unknown"
-                        )
-                        album = (
-                            item.get("album", {}).get("title", "Unknown")
-                            if item.get("album")
-                            else "Unknown"
-                        )
-                        error_message = item.get("errorMessage", "No error message")
-                        print(f"  ✗ {artist} - {album}: {error_message}")
+
+                    # Show details of the first few failed downloads
+                    alert_lines.extend(_describe_failed_items(client, failed_items[:5]))
 
                     if len(failed_items) > 5:
-                        print(f"  ... and {len(failed_items) - 5} more failed items")
+                        alert_lines.append(
+                            f"  ... and {len(failed_items) - 5} more failed items"
+                        )
+
+                    # Emit the whole alert with a single write
+                    sys.stdout.write("\n".join(alert_lines) + "\n")
 
                 else:
                     status_msg = (
@@ -322,51 +447,75 @@ def monitor_queue_continuously(
 
                     print(status_msg)
 
-                time.sleep(interval)
+                stop_event.wait(interval)
 
-            except (ConnectionError, ValueError, KeyError) as e:
+            except REQUEST_ERRORS as e:
                 print(f"Error monitoring queue: {e}")
-                time.sleep(interval)
+                stop_event.wait(interval)
 
     except KeyboardInterrupt:
-        print("\nMonitoring stopped")
+        pass
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    print("\nMonitoring stopped")
 
 
 def check_recent_history(client: LidarrClient, hours: int = 24) -> None:
     """Check recent download history for issues."""
     try:
         # Get history from the last N hours
-        since = datetime.now() - timedelta(hours=hours)
+        since_utc = datetime.now(tz=UTC) - timedelta(hours=hours)
 
-        history = client.get_history(
-            page=1, page_size=100, sort_key="date", sort_dir="desc"
-        )
-        records = history.get("records", [])
-
-        # Filter to recent items
+        # History is sorted newest first, so stop paging at the first older record
         recent_records = []
-        for record in records:
-            try:
-                record_date = datetime.fromisoformat(
-                    record.get("date", "").replace("Z", "+00:00")
-                )
-                if record_date >= since.replace(tzinfo=record_date.tzinfo):
-                    recent_records.append(record)
-            except (ValueError, TypeError, KeyError):
-                continue
+        page = 1
+        while True:
+            history = client.get_history(
+                page=page,
+                page_size=HISTORY_PAGE_SIZE,
+                sort_key="date",
+                sort_direction="descending",
+            )
+            records = history.get("records", [])
+
+            # Filter to recent items, keeping each parsed date for display below
+            reached_older = False
+            for record in records:
+                try:
+                    record_date = _parse_iso(record.get("date", ""))
+                    if record_date.tzinfo is None:
+                        # Lidarr reports UTC; treat timestamps without an offset as UTC
+                        record_date = record_date.replace(tzinfo=UTC)
+                    if record_date >= since_utc:
+                        recent_records.append((record, record_date))
+                    else:
+                        reached_older = True
+                except (ValueError, TypeError, AttributeError, KeyError):
+                    continue
+
+            total_records = history.get("totalRecords", 0)
+            if reached_older or not records or page * HISTORY_PAGE_SIZE >= total_records:
+                break
+            page += 1
 
         if not recent_records:
             print(f"No history items found in the last {hours} hours")
             return
 
-        # Analyze recent history
-        grabbed = len([r for r in recent_records if r.get("eventType") == "grabbed"])
-        imported = len(
-            [r for r in recent_records if r.get("eventType") == "trackFileImported"]
-        )
-        failed = len(
-            [r for r in recent_records if r.get("eventType") == "downloadFailed"]
-        )
+        # Analyze recent history in a single pass
+        event_counts = Counter()
+        failed_items = []
+        for record, record_date in recent_records:
+            event_type = record.get("eventType")
+            event_counts[event_type] += 1
+            if event_type == "downloadFailed":
+                failed_items.append((record, record_date))
+
+        grabbed = event_counts["grabbed"]
+        imported = event_counts["trackFileImported"]
+        failed = event_counts["downloadFailed"]
 
         print(f"Recent Activity (last {hours} hours):")
         print(f"  Grabbed: {grabbed}")
@@ -375,10 +524,7 @@ def check_recent_history(client: LidarrClient, hours: int = 24) -> None:
 
         if failed > 0:
             print("\nRecent Failures:")
-            failed_items = [
-                r for r in recent_records if r.get("eventType") == "downloadFailed"
-            ][:10]
-            for item in failed_items:
+            for item, item_date in failed_items[:10]:
                 artist = (
                     item.get("artist", {}).get("artistName", "Unknown")
                     if item.get("artist")
@@ -389,12 +535,7 @@ def check_recent_history(client: LidarrClient, hours: int = 24) -> None:
                     if item.get("album")
                     else "Unknown"
                 )
-                date = item.get("date", "Unknown")
-                try:
-                    date_obj = datetime.fromisoformat(date.replace("Z", "+00:00"))
-                    date = date_obj.strftime("%Y-%m-%d %H:%M")
-                except (ValueError, TypeError):
-                    pass
+                date = item_date.strftime("%Y-%m-%d %H:%M")
 
                 print(f"  ✗ [{date}] {artist} - {album}")
 
@@ -403,10 +544,106 @@ def check_recent_history(client: LidarrClient, hours: int = 24) -> None:
         success_rate = (imported / total_attempts * 100) if total_attempts > 0 else 0
         print(f"\nSuccess Rate: {success_rate:.1f}% ({imported}/{total_attempts})")
 
-    except (ConnectionError, ValueError, KeyError) as e:
+    except REQUEST_ERRORS as e:
         print(f"Error checking recent history: {e}")
 
 
+def _load_ttl_cache() -> None:
+    """Load the persisted TTL cache once per process."""
+    global _ttl_cache_loaded  # pylint: disable=global-statement
+    if _ttl_cache_loaded:
+        return
+    _ttl_cache_loaded = True
+    try:
+        with open(TTL_CACHE_PATH, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
+    # Ignore a cache file that isn't in the expected {key: [expiry, value]} shape
+    if isinstance(entries, dict):
+        _TTL_CACHE.update(
+            (key, entry) for key, entry in entries.items()
+            if isinstance(entry, list) and len(entry) == 2
+            and isinstance(entry[0], (int, float))
+        )
+
+
+def _save_ttl_cache() -> None:
+    """Persist unexpired TTL cache entries so separate runs share them."""
+    now = time.time()
+    entries = {key: entry for key, entry in _TTL_CACHE.items() if entry[0] > now}
+    try:
+        os.makedirs(os.path.dirname(TTL_CACHE_PATH), exist_ok=True)
+        with open(TTL_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except OSError:
+        pass
+
+
+def ttl_cache(seconds: int) -> Callable:
+    """Cache a helper's result per Lidarr server for the given number of seconds."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(client: LidarrClient) -> Any:
+            _load_ttl_cache()
+            key = f"{client.base_url}|{func.__name__}"
+            now = time.time()
+            entry = _TTL_CACHE.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            value = func(client)
+            _TTL_CACHE[key] = [now + seconds, value]
+            _save_ttl_cache()
+            return value
+        return wrapper
+    return decorator
+
+
+@ttl_cache(300)
+def _artist_statistics(client: LidarrClient) -> Dict[str, int]:
+    """Get total and monitored artist counts."""
+    artists = client.get_all_artists()
+    return {
+        "total_artists": len(artists),
+        "monitored_artists": len([a for a in artists if a.get("monitored")]),
+    }
+
+
+@ttl_cache(3600)
+def _profile_counts(client: LidarrClient) -> Dict[str, int]:
+    """Get quality and metadata profile counts."""
+    return {
+        "quality_profiles_count": len(client.get_quality_profiles()),
+        "metadata_profiles_count": len(client.get_metadata_profiles()),
+    }
+
+
+@ttl_cache(3600)
+def _import_list_counts(client: LidarrClient) -> Dict[str, int]:
+    """Get total and enabled import list counts."""
+    import_lists = client.get_import_lists()
+    return {
+        "total_lists": len(import_lists),
+        "enabled_lists": len(
+            [import_list for import_list in import_lists if import_list.get("enabled")]
+        ),
+    }
+
+
+def _write_json_report(report: Dict[str, Any], output_file: str) -> None:
+    """Write a report as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        return
+
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+
 def export_health_report(client: LidarrClient, output_file: str) -> None:
     """Export a comprehensive health report to JSON."""
     try:
@@ -414,49 +651,29 @@ def export_health_report(client: LidarrClient, output_file: str) -> None:
 
         report = system_status_check(client, verbose=False)
 
-        # Add additional details for export
+        # Add additional details for export. These change slowly, so they are
+        # cached for a short time and shared between runs.
         try:
             # Add artist count
-            artists = client.get_all_artists()
-            report["checks"]["total_artists"] = len(artists)
-            report["checks"]["monitored_artists"] = len(
-                [a for a in artists if a.get("monitored")]
-            )
-        except (ConnectionError, ValueError, KeyError) as e:
+            report["checks"].update(_artist_statistics(client))
+        except REQUEST_ERRORS as e:
             report["warnings"].append(f"Failed to get artist statistics: {str(e)}")
 
         try:
             # Add profile information
-            quality_profiles = client.get_quality_profiles()
-            metadata_profiles = client.get_metadata_profiles()
-            report["checks"]["profiles"] = {
-                "quality_profiles_count": len(quality_profiles),
-                "metadata_profiles_count": len(metadata_profiles),
-            }
-        except (ConnectionError, ValueError, KeyError) as e:
+            report["checks"]["profiles"] = _profile_counts(client)
+        except REQUEST_ERRORS as e:
             report["warnings"].append(f"Failed to get profile information: {str(e)}")
 
         try:
             # Add import list information
-            import_lists = client.get_import_lists()
-            enabled_lists = len(
-                [
-                    import_list
-                    for import_list in import_lists
-                    if import_list.get("enabled")
-                ]
-            )
-            report["checks"]["import_lists"] = {
-                "total_lists": len(import_lists),
-                "enabled_lists": enabled_lists,
-            }
-        except (ConnectionError, ValueError, KeyError) as e:
+            report["checks"]["import_lists"] = _import_list_counts(client)
+        except REQUEST_ERRORS as e:
             report["warnings"].append(
                 f"Failed to get import list information: {str(e)}"
             )
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_json_report(report, output_file)
 
         print(f"Health report exported to {output_file}")
         print(f"Overall status: {report['status'].upper()}")
@@ -544,6 +761,11 @@ Examples:
         parser.print_help()
         return 1
 
+    # Flush output line by line even when piped (e.g. to journald), so each
+    # status line or alert batch reaches the log as a single write
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     try:
         client = setup_client(args)
 
@@ -583,7 +805,7 @@ Examples:
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
         return 130
-    except (ConnectionError, ValueError, KeyError, TypeError) as e:
+    except (*REQUEST_ERRORS, TypeError) as e:
         print(f"Error: {e}")
         return 1
 
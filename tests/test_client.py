@@ -1,21 +1,170 @@
 # flake8: noqa pylint: disable=W,C,R
 
+import json
+import os
 import pytest
 import requests
 import responses
-import time
 import logging
-from datetime import datetime
+import types
+import uuid
 from lidarr_api import LidarrClient
+from lidarr_api import client as client_module
 from tests.config import LIDARR_URL, LIDARR_API_KEY
 
 
+# Mocked endpoint URLs
+API_URL = f'{LIDARR_URL}/api/v1'
+URL_ALBUM_1_RELEASES = f'{API_URL}/album/1/releases'
+URL_ARTIST_1 = f'{API_URL}/artist/1'
+URL_ARTIST_LOOKUP = f'{API_URL}/artist/lookup'
+URL_ARTIST_METADATA_123 = f'{API_URL}/artistmetadata/123'
+URL_BLOCKLIST = f'{API_URL}/blocklist'
+URL_COMMAND = f'{API_URL}/command'
+URL_HISTORY = f'{API_URL}/history'
+URL_QUALITY_PROFILE = f'{API_URL}/qualityprofile'
+URL_QUEUE = f'{API_URL}/queue'
+URL_ROOT_FOLDER = f'{API_URL}/rootfolder'
+URL_SYSTEM_STATUS = f'{API_URL}/system/status'
+URL_TAG = f'{API_URL}/tag'
+URL_WANTED = f'{API_URL}/wanted/missing'
+
+
+# Canned API responses for the unit tests
+SYSTEM_STATUS = {
+    "version": "1.0.2.2587",
+    "buildTime": "2023-09-18T10:00:00Z",
+    "isDebug": False,
+    "isProduction": True,
+    "isAdmin": True,
+    "isUserInteractive": True,
+    "startupPath": "/app/lidarr",
+    "appData": "/config",
+    "osVersion": "debian 11.0",
+    "isNetCore": True,
+    "isMono": False,
+    "isLinux": True,
+    "isOsx": False,
+    "isWindows": False,
+    "mode": "console",
+    "branch": "master",
+    "authentication": "none",
+    "sqliteVersion": "3.35.5",
+    "migrationVersion": 189
+}
+
+ARTIST_LOOKUP = [{
+    "id": 123,
+    "artistName": "The Beatles",
+    "overview": "The Beatles were an English rock band...",
+    "status": "ended"
+}]
+
+QUALITY_PROFILES = [{
+    "id": 1,
+    "name": "FLAC",
+    "cutoff": {"id": 1, "name": "FLAC"},
+    "items": []
+}]
+
+WANTED = {
+    "page": 1,
+    "pageSize": 10,
+    "sortKey": "releaseDate",
+    "sortDirection": "descending",
+    "totalRecords": 1,
+    "records": [{
+        "id": 123,
+        "title": "Some Album",
+        "artistId": 456,
+        "releaseDate": "2025-09-18"
+    }]
+}
+
+ARTIST_METADATA = {
+    "id": 123,
+    "lastInfoSync": "2023-09-18T10:00:00Z",
+    "foreignArtistId": "abc123",
+    "sizeOnDisk": 1234567,
+    "path": "/music/TheArtist"
+}
+
+ROOT_FOLDERS = [{
+    "id": 1,
+    "path": "/music",
+    "accessible": True,
+    "freeSpace": 1234567890
+}]
+
+QUEUE = {
+    "page": 1,
+    "pageSize": 10,
+    "totalRecords": 1,
+    "records": [{
+        "id": 123,
+        "albumId": 456,
+        "status": "downloading",
+        "title": "Album Title"
+    }]
+}
+
+ALBUM_RELEASES = [{
+    "id": 1,
+    "guid": "123-456",
+    "quality": {"quality": {"id": 1, "name": "FLAC"}},
+    "qualityWeight": 1,
+    "age": 0,
+    "seeders": 0,
+    "indexer": "Test Indexer",
+    "title": "Test Album Release"
+}]
+
+TAGS = [
+    {"id": 1, "label": "test-tag"},
+    {"id": 2, "label": "another-tag"}
+]
+
+BLOCKLIST = {
+    "page": 1,
+    "pageSize": 10,
+    "total": 1,
+    "records": [{
+        "id": 1,
+        "sourceTitle": "Test Release",
+        "quality": {"quality": {"id": 1, "name": "FLAC"}},
+        "date": "2025-09-18T00:00:00Z"
+    }]
+}
+
+
+# Pre-serialized once so requests_mock serves the text without re-encoding it per test
+SYSTEM_STATUS_JSON = json.dumps(SYSTEM_STATUS)
+ARTIST_LOOKUP_JSON = json.dumps(ARTIST_LOOKUP)
+QUALITY_PROFILES_JSON = json.dumps(QUALITY_PROFILES)
+WANTED_JSON = json.dumps(WANTED)
+ARTIST_METADATA_JSON = json.dumps(ARTIST_METADATA)
+ROOT_FOLDERS_JSON = json.dumps(ROOT_FOLDERS)
+QUEUE_JSON = json.dumps(QUEUE)
+ALBUM_RELEASES_JSON = json.dumps(ALBUM_RELEASES)
+TAGS_JSON = json.dumps(TAGS)
+BLOCKLIST_JSON = json.dumps(BLOCKLIST)
+
+
 # Fixtures for both test suites
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
     return LidarrClient(base_url=LIDARR_URL, api_key=LIDARR_API_KEY)
 
 
+@pytest.fixture(scope="module")
+def beatles(client):
+    """Look up an artist once for the integration tests that need one"""
+    artists = client.search_artist('The Beatles')
+    if not artists:
+        pytest.skip("No artists found for 'The Beatles'")
+    return artists[0]
+
+
 @pytest.fixture
 def mock_responses():
     with responses.RequestsMock() as rsps:
@@ -25,208 +174,85 @@ def mock_responses():
 class TestLidarrClientUnit:
     """Unit tests using mocked responses"""
 
+    @pytest.fixture(autouse=True)
+    def reset_rate_limit(self, client):
+        # The client is shared across the module; don't let one test's
+        # request throttle the next one
+        client.last_request_time = 0.0
+
     def test_client_initialization(self, client):
         assert client.base_url == LIDARR_URL
         assert client.api_key == LIDARR_API_KEY
         assert client.session.headers['X-Api-Key'] == LIDARR_API_KEY
         assert client.session.headers['Content-Type'] == 'application/json'
 
-    def test_get_system_status(self, client, mock_responses):
-        expected_response = {
-            "version": "1.0.2.2587",
-            "buildTime": "2023-09-18T10:00:00Z",
-            "isDebug": False,
-            "isProduction": True,
-            "isAdmin": True,
-            "isUserInteractive": True,
-            "startupPath": "/app/lidarr",
-            "appData": "/config",
-            "osVersion": "debian 11.0",
-            "isNetCore": True,
-            "isMono": False,
-            "isLinux": True,
-            "isOsx": False,
-            "isWindows": False,
-            "mode": "console",
-            "branch": "master",
-            "authentication": "none",
-            "sqliteVersion": "3.35.5",
-            "migrationVersion": 189
-        }
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/system/status',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.get_system_status()
-        assert response == expected_response
-
-    def test_search_artist(self, client, mock_responses):
-        expected_response = [{
-            "id": 123,
-            "artistName": "The Beatles",
-            "overview": "The Beatles were an English rock band...",
-            "status": "ended"
-        }]
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/artist/lookup',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.search_artist('The Beatles')
-        assert response == expected_response
-
-    def test_get_quality_profiles(self, client, mock_responses):
-        expected_response = [{
-            "id": 1,
-            "name": "FLAC",
-            "cutoff": {"id": 1, "name": "FLAC"},
-            "items": []
-        }]
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/qualityprofile',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.get_quality_profiles()
-        assert response == expected_response
+    def test_connection_pool_settings(self):
+        client = LidarrClient(LIDARR_URL, LIDARR_API_KEY, pool_connections=2, pool_maxsize=8)
+        adapter = client.session.get_adapter(LIDARR_URL)
+        assert adapter is client.session.get_adapter('https://example.com')
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 8
 
-    def test_get_wanted(self, client, mock_responses):
-        expected_response = {
-            "page": 1,
-            "pageSize": 10,
-            "sortKey": "releaseDate",
-            "sortDirection": "descending",
-            "totalRecords": 1,
-            "records": [{
-                "id": 123,
-                "title": "Some Album",
-                "artistId": 456,
-                "releaseDate": "2025-09-18"
-            }]
-        }
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/wanted/missing',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.get_wanted()
-        assert response == expected_response
-        assert response["page"] == 1
-        assert response["pageSize"] == 10
-
-    def test_get_metadata(self, client, mock_responses):
-        expected_response = {
-            "id": 123,
-            "lastInfoSync": "2023-09-18T10:00:00Z",
-            "foreignArtistId": "abc123",
-            "sizeOnDisk": 1234567,
-            "path": "/music/TheArtist"
-        }
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/artistmetadata/123',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.get_metadata(123)
-        assert response == expected_response
-
-    def test_search_album(self, client, mock_responses):
+    def test_search_album(self, client, requests_mock):
         expected_response = {
             "id": 789,
             "name": "AlbumSearch",
             "status": "queued"
         }
 
-        mock_responses.add(
-            responses.POST,
-            f'{LIDARR_URL}/api/v1/command',
-            json=expected_response,
-            status=200
+        requests_mock.post(
+            URL_COMMAND,
+            json=expected_response
         )
 
         response = client.search_album(456)
         assert response == expected_response
 
-    def test_get_root_folders(self, client, mock_responses):
-        expected_response = [{
-            "id": 1,
-            "path": "/music",
-            "accessible": True,
-            "freeSpace": 1234567890
-        }]
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/rootfolder',
-            json=expected_response,
-            status=200
-        )
-
-        response = client.get_root_folders()
+    @pytest.mark.parametrize("method_name,args,url,expected_response,body", [
+        ('get_system_status', (), URL_SYSTEM_STATUS, SYSTEM_STATUS, SYSTEM_STATUS_JSON),
+        ('search_artist', ('The Beatles',), URL_ARTIST_LOOKUP, ARTIST_LOOKUP, ARTIST_LOOKUP_JSON),
+        ('get_quality_profiles', (), URL_QUALITY_PROFILE, QUALITY_PROFILES, QUALITY_PROFILES_JSON),
+        ('get_wanted', (), URL_WANTED, WANTED, WANTED_JSON),
+        ('get_metadata', (123,), URL_ARTIST_METADATA_123, ARTIST_METADATA, ARTIST_METADATA_JSON),
+        ('get_root_folders', (), URL_ROOT_FOLDER, ROOT_FOLDERS, ROOT_FOLDERS_JSON),
+        ('get_queue', (), URL_QUEUE, QUEUE, QUEUE_JSON),
+        ('get_album_releases', (1,), URL_ALBUM_1_RELEASES, ALBUM_RELEASES, ALBUM_RELEASES_JSON),
+        ('get_tags', (), URL_TAG, TAGS, TAGS_JSON),
+        ('get_blocklist', (), URL_BLOCKLIST, BLOCKLIST, BLOCKLIST_JSON)
+    ])
+    def test_get_endpoint(self, client, requests_mock, method_name, args, url,
+                          expected_response, body):
+        requests_mock.get(url, text=body)
+
+        response = getattr(client, method_name)(*args)
         assert response == expected_response
 
-    def test_get_queue(self, client, mock_responses):
-        expected_response = {
-            "page": 1,
-            "pageSize": 10,
-            "totalRecords": 1,
-            "records": [{
-                "id": 123,
-                "albumId": 456,
-                "status": "downloading",
-                "title": "Album Title"
-            }]
-        }
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/queue',
-            json=expected_response,
-            status=200
+    def test_get_queue_without_details(self, client, requests_mock):
+        requests_mock.get(
+            URL_QUEUE,
+            json={"page": 1, "pageSize": 100, "totalRecords": 0, "records": []}
         )
 
-        response = client.get_queue()
-        assert response == expected_response
-
-    def test_get_album_releases(self, client, mock_responses):
-        expected_response = [{
-            "id": 1,
-            "guid": "123-456",
-            "quality": {"quality": {"id": 1, "name": "FLAC"}},
-            "qualityWeight": 1,
-            "age": 0,
-            "seeders": 0,
-            "indexer": "Test Indexer",
-            "title": "Test Album Release"
-        }]
-
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/album/1/releases',
-            json=expected_response,
-            status=200
+        client.get_queue(page_size=100, include_artist=False, include_album=False)
+        params = requests_mock.request_history[0].qs
+        assert params['pageSize'] == ['100']
+        assert params['includeArtist'] == ['false']
+        assert params['includeAlbum'] == ['false']
+        assert params['includeUnknownArtistItems'] == ['false']
+
+    def test_get_history_sorted(self, client, requests_mock):
+        requests_mock.get(
+            URL_HISTORY,
+            json={"page": 2, "pageSize": 100, "totalRecords": 0, "records": []}
         )
 
-        response = client.get_album_releases(1)
-        assert response == expected_response
+        client.get_history(page=2, page_size=100, sort_key='date', sort_direction='descending')
+        params = requests_mock.request_history[0].qs
+        assert params['page'] == ['2']
+        assert params['sortKey'] == ['date']
+        assert params['sortDirection'] == ['descending']
 
-    def test_update_artist_monitor(self, client, mock_responses):
+    def test_update_artist_monitor(self, client, requests_mock):
         artist_data = {
             "id": 1,
             "artistName": "Test Artist",
@@ -234,118 +260,122 @@ class TestLidarrClientUnit:
         }
 
         # Mock get artist request
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/artist/1',
-            json=artist_data,
-            status=200
+        requests_mock.get(
+            URL_ARTIST_1,
+            json=artist_data
         )
 
         # Mock update request
-        mock_responses.add(
-            responses.PUT,
-            f'{LIDARR_URL}/api/v1/artist/1',
-            json={**artist_data, "monitored": True},
-            status=200
+        requests_mock.put(
+            URL_ARTIST_1,
+            json={**artist_data, "monitored": True}
         )
 
         response = client.update_artist_monitor(1, True)
         assert response["monitored"] is True
 
-    def test_get_tags(self, client, mock_responses):
-        expected_response = [
-            {"id": 1, "label": "test-tag"},
-            {"id": 2, "label": "another-tag"}
-        ]
+    def test_add_tag(self, client, requests_mock):
+        expected_response = {"id": 1, "label": "new-tag"}
 
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/tag',
-            json=expected_response,
-            status=200
+        requests_mock.post(
+            URL_TAG,
+            json=expected_response
         )
 
-        response = client.get_tags()
+        response = client.add_tag("new-tag")
         assert response == expected_response
 
-    def test_add_tag(self, client, mock_responses):
-        expected_response = {"id": 1, "label": "new-tag"}
+    def test_etag_cache(self, requests_mock, tmp_path):
+        """Test that cached profiles are reused on 304 Not Modified"""
+        expected_response = [{"id": 1, "name": "FLAC"}]
+        cache_path = str(tmp_path / "etag.db")
 
-        mock_responses.add(
-            responses.POST,
-            f'{LIDARR_URL}/api/v1/tag',
-            json=expected_response,
-            status=200
+        client = LidarrClient(LIDARR_URL, LIDARR_API_KEY,
+                              rate_limit_per_second=100.0, etag_cache_path=cache_path)
+
+        requests_mock.get(
+            URL_QUALITY_PROFILE,
+            [
+                {'json': expected_response, 'headers': {'ETag': '"v1"'}},
+                {'status_code': 304}
+            ]
         )
 
-        response = client.add_tag("new-tag")
-        assert response == expected_response
+        assert client.get_quality_profiles() == expected_response
 
-    def test_get_blocklist(self, client, mock_responses):
-        expected_response = {
-            "page": 1,
-            "pageSize": 10,
-            "total": 1,
-            "records": [{
-                "id": 1,
-                "sourceTitle": "Test Release",
-                "quality": {"quality": {"id": 1, "name": "FLAC"}},
-                "date": "2025-09-18T00:00:00Z"
-            }]
-        }
+        # A new client shares the persisted cache
+        client = LidarrClient(LIDARR_URL, LIDARR_API_KEY, etag_cache_path=cache_path)
+        assert client.get_quality_profiles() == expected_response
+        assert 'If-None-Match' not in requests_mock.request_history[0].headers
+        assert requests_mock.request_history[1].headers['If-None-Match'] == '"v1"'
 
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/blocklist',
-            json=expected_response,
-            status=200
-        )
+    def test_etag_cache_unwritable_path(self, requests_mock, tmp_path):
+        """Test that a cache path that can't be created disables caching"""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
 
-        response = client.get_blocklist()
-        assert response == expected_response
+        client = LidarrClient(LIDARR_URL, LIDARR_API_KEY,
+                              etag_cache_path=str(blocker / "etag.db"))
+        assert client.etag_cache is None
+
+        requests_mock.get(URL_QUALITY_PROFILE, json=QUALITY_PROFILES)
+        assert client.get_quality_profiles() == QUALITY_PROFILES
+        assert 'If-None-Match' not in requests_mock.request_history[0].headers
 
-    def test_rate_limiting(self, client, mock_responses):
+    def test_rate_limiting(self, client, requests_mock, monkeypatch):
         """Test that rate limiting is working"""
         expected_response = {"status": "ok"}
 
+        # Replace the client's clock so throttling advances virtual time only
+        clock = {"now": 1000.0}
+
+        def fake_sleep(seconds):
+            clock["now"] += seconds
+
+        monkeypatch.setattr(client_module, "time",
+                            types.SimpleNamespace(time=lambda: clock["now"], sleep=fake_sleep))
+
         # Configure client with 2 requests per second
         client = LidarrClient(LIDARR_URL, LIDARR_API_KEY, rate_limit_per_second=2.0)
 
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/system/status',
-            json=expected_response,
-            status=200
+        requests_mock.get(
+            URL_SYSTEM_STATUS,
+            json=expected_response
         )
 
         # Make three quick requests
-        start_time = time.time()
+        start_time = clock["now"]
         client.get_system_status()
         client.get_system_status()
         client.get_system_status()
-        end_time = time.time()
+        end_time = clock["now"]
 
         # Should take at least 1 second for 3 requests at 2 req/sec
         assert end_time - start_time >= 1.0
 
-    def test_retry_mechanism(self, client, mock_responses):
+    def test_retry_mechanism(self, client, mock_responses, monkeypatch):
         """Test that retry mechanism works for failed requests"""
+        # Retries happen inside urllib3, below the transport adapter that
+        # requests_mock replaces, so this test mocks at the urllib3 level instead
         expected_response = {"status": "ok"}
 
+        # Don't wait out the backoff between attempts
+        monkeypatch.setattr("urllib3.util.retry.Retry.sleep", lambda *args, **kwargs: None)
+
         # Configure client with retries
         client = LidarrClient(LIDARR_URL, LIDARR_API_KEY, retry_total=2)
 
         # Add a failed response followed by a successful one
         mock_responses.add(
             responses.GET,
-            f'{LIDARR_URL}/api/v1/system/status',
+            URL_SYSTEM_STATUS,
             json={"error": "Server Error"},
             status=500
         )
 
         mock_responses.add(
             responses.GET,
-            f'{LIDARR_URL}/api/v1/system/status',
+            URL_SYSTEM_STATUS,
             json=expected_response,
             status=200
         )
@@ -353,14 +383,13 @@ class TestLidarrClientUnit:
         response = client.get_system_status()
         assert response == expected_response
 
-    def test_timeout_setting(self, client, mock_responses):
+    def test_timeout_setting(self, client, requests_mock):
         """Test that timeout is properly set"""
         client = LidarrClient(LIDARR_URL, LIDARR_API_KEY, timeout=1)
 
-        mock_responses.add(
-            responses.GET,
-            f'{LIDARR_URL}/api/v1/system/status',
-            body=requests.exceptions.Timeout()
+        requests_mock.get(
+            URL_SYSTEM_STATUS,
+            exc=requests.exceptions.Timeout
         )
 
         with pytest.raises(requests.exceptions.Timeout):
@@ -385,6 +414,42 @@ class TestLidarrClientUnit:
 class TestLidarrClientIntegration:
     """Integration tests using actual Lidarr server"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    def response_cache(self, client):
+        # Opt in with LIDARR_TEST_CACHE=1 to replay GET responses from disk on
+        # repeat local runs. Tags are never cached since the tag test changes them.
+        if not os.environ.get("LIDARR_TEST_CACHE"):
+            yield
+            return
+
+        import requests_cache
+
+        session = client.session
+        cached_session = requests_cache.CachedSession(
+            cache_name='.lidarr_test_cache',
+            backend='sqlite',
+            allowable_methods=('GET',),
+            ignored_parameters=('X-Api-Key',),
+            urls_expire_after={
+                f'{URL_TAG}*': requests_cache.DO_NOT_CACHE,
+                '*': requests_cache.NEVER_EXPIRE
+            }
+        )
+        cached_session.headers.update(session.headers)
+        for prefix, adapter in session.adapters.items():
+            cached_session.mount(prefix, adapter)
+
+        client.session = cached_session
+        yield
+        client.session = session
+        cached_session.close()
+
+    @pytest.fixture(scope="class", autouse=True)
+    def warm_connection(self, client, response_cache):
+        # Open the keep-alive connection once so the first test doesn't
+        # pay for the TCP/TLS handshake on its own
+        client.get_system_status()
+
     @pytest.mark.integration
     def test_system_status_integration(self, client):
         """Test that we can connect to the actual Lidarr server and get system status"""
@@ -394,13 +459,10 @@ class TestLidarrClientIntegration:
         assert 'buildTime' in response
 
     @pytest.mark.integration
-    def test_artist_search_integration(self, client):
+    def test_artist_search_integration(self, beatles):
         """Test artist search against the actual Lidarr server"""
-        response = client.search_artist('The Beatles')
-        assert isinstance(response, list)
-        if response:  # Some results were found
-            assert 'artistName' in response[0]
-            assert 'id' in response[0]
+        assert 'artistName' in beatles
+        assert 'id' in beatles
 
     @pytest.mark.integration
     def test_get_calendar_integration(self, client):
@@ -442,22 +504,17 @@ class TestLidarrClientIntegration:
         assert isinstance(response, list)
 
     @pytest.mark.integration
-    def test_metadata_integration(self, client):
+    def test_metadata_integration(self, client, beatles):
         """Test getting metadata for the first available artist"""
-        # First get an artist to test with
-        artists = client.search_artist('The Beatles')
-        if artists:
-            # Get the first artist ID
-            artist_id = artists[0]['id']
-            # Get the full artist details to get the metadata ID
-            artist = client.get_artist(artist_id)
-            if artist and 'artistMetadataId' in artist:
-                metadata_id = artist['artistMetadataId']
-                response = client.get_metadata(metadata_id)
-                assert isinstance(response, dict)
-                assert 'id' in response
-            else:
-                pytest.skip("No artist metadata ID available")
+        # Get the full artist details to get the metadata ID
+        artist = client.get_artist(beatles['id'])
+        if artist and 'artistMetadataId' in artist:
+            metadata_id = artist['artistMetadataId']
+            response = client.get_metadata(metadata_id)
+            assert isinstance(response, dict)
+            assert 'id' in response
+        else:
+            pytest.skip("No artist metadata ID available")
 
     @pytest.mark.integration
     def test_root_folders_integration(self, client):
@@ -493,15 +550,9 @@ class TestLidarrClientIntegration:
         assert 'records' in response
 
     @pytest.mark.integration
-    def test_album_releases_integration(self, client):
+    def test_album_releases_integration(self, client, beatles):
         """Test getting album releases from the actual server"""
-        # First get an artist to test with
-        artists = client.search_artist('The Beatles')
-        if not artists:
-            pytest.skip("No artists found for release test")
-
-        artist_id = artists[0]['id']
-        albums = client.get_albums_by_artist(artist_id)
+        albums = client.get_albums_by_artist(beatles['id'])
         if not albums:
             pytest.skip("No albums found for release test")
 
@@ -518,7 +569,7 @@ class TestLidarrClientIntegration:
     def test_tags_integration(self, client):
         """Test tag management"""
         # Create a new tag
-        tag_name = "test-tag-" + datetime.now().strftime("%Y%m%d%H%M%S")
+        tag_name = f"test-tag-{uuid.uuid4().hex[:12]}"
         new_tag = client.add_tag(tag_name)
         assert new_tag['label'] == tag_name
 
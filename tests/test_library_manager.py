@@ -0,0 +1,70 @@
+# flake8: noqa pylint: disable=W,C,R
+
+import argparse
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+# Imported as a module so pytest doesn't collect test_all_import_lists as a test
+from scripts import library_manager
+
+
+class TestTestAllImportLists:
+    """Tests for the concurrent import list check"""
+
+    def test_summary(self, capsys):
+        results = {
+            1: {"isValid": True},
+            2: {"isValid": False, "validationFailures": [{}, {}]},
+            3: {"isValid": True},
+        }
+        client = Mock()
+        client.get_import_lists.return_value = [{"id": 1}, {"id": 2}, {"id": 3}]
+        client.test_import_list.side_effect = results.__getitem__
+
+        library_manager.test_all_import_lists(client, max_workers=2)
+
+        output = capsys.readouterr().out
+        assert "1: OK" in output
+        assert "2: FAIL (2 errors)" in output
+        assert "3: OK" in output
+        assert "2 of 3 import lists passed" in output
+
+    def test_exception_in_one_test(self, capsys):
+        def test_import_list(list_id):
+            if list_id == 2:
+                raise requests.exceptions.ConnectionError("connection refused")
+            return {"isValid": True}
+
+        client = Mock()
+        client.get_import_lists.return_value = [{"id": 1}, {"id": 2}]
+        client.test_import_list.side_effect = test_import_list
+
+        library_manager.test_all_import_lists(client)
+
+        output = capsys.readouterr().out
+        assert "1: OK" in output
+        assert "2: FAIL (connection refused)" in output
+        assert "1 of 2 import lists passed" in output
+
+    def test_no_import_lists(self, capsys):
+        client = Mock()
+        client.get_import_lists.return_value = []
+
+        library_manager.test_all_import_lists(client)
+
+        assert "No import lists configured" in capsys.readouterr().out
+        client.test_import_list.assert_not_called()
+
+
+class TestPositiveInt:
+    """Tests for the --workers argument type"""
+
+    def test_valid(self):
+        assert library_manager._positive_int("3") == 3
+
+    @pytest.mark.parametrize("value", ["0", "-1", "abc"])
+    def test_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            library_manager._positive_int(value)
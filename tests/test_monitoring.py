@@ -0,0 +1,350 @@
+# flake8: noqa pylint: disable=W,C,R
+
+import json
+import threading
+import types
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from lidarr_api import LidarrClient
+from scripts import monitoring
+from tests.config import LIDARR_URL, LIDARR_API_KEY
+
+
+URL_QUEUE = f'{LIDARR_URL}/api/v1/queue'
+URL_HISTORY = f'{LIDARR_URL}/api/v1/history'
+
+
+@pytest.fixture
+def client():
+    return LidarrClient(LIDARR_URL, LIDARR_API_KEY, rate_limit_per_second=1000.0)
+
+
+def paged_response(records, page_size):
+    """Serve `records` as Lidarr-style pages, picking the page from the query string"""
+    def callback(request, context):
+        page = int(request.qs['page'][0])
+        start = (page - 1) * page_size
+        return {
+            "page": page,
+            "pageSize": page_size,
+            "totalRecords": len(records),
+            "records": records[start:start + page_size]
+        }
+    return callback
+
+
+def requested_pages(requests_mock):
+    return sorted(int(request.qs['page'][0]) for request in requests_mock.request_history)
+
+
+def history_record(event_type, age, date=None):
+    if date is None:
+        date = (datetime.now(timezone.utc) - age).isoformat().replace('+00:00', 'Z')
+    return {"eventType": event_type, "date": date}
+
+
+class TestFetchQueueRecords:
+    """Tests for reading every page of the download queue"""
+
+    def test_fetches_all_pages(self, client, requests_mock):
+        queue = [{"id": i, "status": "downloading"} for i in range(250)]
+        requests_mock.get(URL_QUEUE, json=paged_response(queue, monitoring.QUEUE_PAGE_SIZE))
+
+        records, total = monitoring._fetch_queue_records(
+            client, include_artist=False, include_album=False
+        )
+
+        assert total == 250
+        assert [record["id"] for record in records] == list(range(250))
+        assert requested_pages(requests_mock) == [1, 2, 3]
+        assert all(request.qs['includeArtist'] == ['false']
+                   for request in requests_mock.request_history)
+
+    def test_single_page(self, client, requests_mock):
+        queue = [{"id": i, "status": "queued"} for i in range(5)]
+        requests_mock.get(URL_QUEUE, json=paged_response(queue, monitoring.QUEUE_PAGE_SIZE))
+
+        records, total = monitoring._fetch_queue_records(client)
+
+        assert total == 5
+        assert len(records) == 5
+        assert requested_pages(requests_mock) == [1]
+
+
+class TestCheckRecentHistory:
+    """Tests for paging through recent download history"""
+
+    def test_stops_at_first_older_record(self, client, requests_mock, capsys):
+        # Page 1 already reaches past the 24 hour window
+        history = [history_record("grabbed", timedelta(hours=1)) for _ in range(99)]
+        history += [history_record("grabbed", timedelta(hours=30)) for _ in range(201)]
+        requests_mock.get(URL_HISTORY, json=paged_response(history, monitoring.HISTORY_PAGE_SIZE))
+
+        monitoring.check_recent_history(client, hours=24)
+
+        assert requested_pages(requests_mock) == [1]
+        request = requests_mock.request_history[0]
+        assert request.qs['sortKey'] == ['date']
+        assert request.qs['sortDirection'] == ['descending']
+        assert "Grabbed: 99" in capsys.readouterr().out
+
+    def test_stops_at_total_records(self, client, requests_mock, capsys):
+        history = [history_record("trackFileImported", timedelta(minutes=5))
+                   for _ in range(150)]
+        requests_mock.get(URL_HISTORY, json=paged_response(history, monitoring.HISTORY_PAGE_SIZE))
+
+        monitoring.check_recent_history(client, hours=24)
+
+        assert requested_pages(requests_mock) == [1, 2]
+        assert "Imported: 150" in capsys.readouterr().out
+
+    def test_skips_unparseable_records(self, client, requests_mock, capsys):
+        naive_date = (datetime.now(timezone.utc) - timedelta(hours=2)).replace(tzinfo=None)
+        history = [
+            history_record("downloadFailed", timedelta(hours=1)),
+            {"eventType": "downloadFailed", "date": "not-a-date"},
+            {"eventType": "downloadFailed"},
+            {"eventType": "downloadFailed", "date": None},
+            # Timestamps without an offset are read as UTC
+            history_record("grabbed", None, date=naive_date.isoformat()),
+        ]
+        requests_mock.get(URL_HISTORY, json=paged_response(history, monitoring.HISTORY_PAGE_SIZE))
+
+        monitoring.check_recent_history(client, hours=24)
+
+        output = capsys.readouterr().out
+        assert "Grabbed: 1" in output
+        assert "Failed: 1" in output
+        assert "Error checking recent history" not in output
+
+
+class TestTTLCache:
+    """Tests for the persistent TTL cache around slow-changing lookups"""
+
+    @pytest.fixture(autouse=True)
+    def ttl_cache_file(self, tmp_path, monkeypatch):
+        cache_path = tmp_path / "ttl.json"
+        monkeypatch.setattr(monitoring, "TTL_CACHE_PATH", str(cache_path))
+        monkeypatch.setattr(monitoring, "_TTL_CACHE", {})
+        monkeypatch.setattr(monitoring, "_ttl_cache_loaded", False)
+        return cache_path
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = {"time": 1000.0}
+        monkeypatch.setattr(monitoring, "time", types.SimpleNamespace(time=lambda: now["time"]))
+        return now
+
+    @pytest.fixture
+    def artists_client(self):
+        client = Mock(base_url=LIDARR_URL)
+        client.get_all_artists.return_value = [{"monitored": True}, {"monitored": False}]
+        return client
+
+    def new_process(self, monkeypatch):
+        # Forget the in-memory cache as a separate run of the script would
+        monkeypatch.setattr(monitoring, "_TTL_CACHE", {})
+        monkeypatch.setattr(monitoring, "_ttl_cache_loaded", False)
+
+    def test_hit_within_ttl(self, artists_client, clock, monkeypatch):
+        expected = {"total_artists": 2, "monitored_artists": 1}
+        assert monitoring._artist_statistics(artists_client) == expected
+
+        clock["time"] += 299
+        self.new_process(monkeypatch)
+        assert monitoring._artist_statistics(artists_client) == expected
+        assert artists_client.get_all_artists.call_count == 1
+
+    def test_expired_entry_is_refreshed(self, artists_client, clock):
+        monitoring._artist_statistics(artists_client)
+
+        clock["time"] += 301
+        monitoring._artist_statistics(artists_client)
+        assert artists_client.get_all_artists.call_count == 2
+
+    def test_entries_are_per_server(self, artists_client, clock):
+        monitoring._artist_statistics(artists_client)
+        artists_client.base_url = "http://other-lidarr:8686"
+        monitoring._artist_statistics(artists_client)
+        assert artists_client.get_all_artists.call_count == 2
+
+    @pytest.mark.parametrize("content", ["{not json", "[1, 2]", '{"key": 5}'])
+    def test_corrupt_cache_file_is_ignored(self, artists_client, clock, ttl_cache_file,
+                                           content):
+        ttl_cache_file.write_text(content)
+
+        result = monitoring._artist_statistics(artists_client)
+        assert result == {"total_artists": 2, "monitored_artists": 1}
+        assert artists_client.get_all_artists.call_count == 1
+
+        # The corrupt file is replaced with valid entries
+        assert isinstance(json.loads(ttl_cache_file.read_text()), dict)
+
+    def test_failed_lookup_is_not_cached(self, artists_client, clock, ttl_cache_file):
+        artists_client.get_all_artists.side_effect = requests.exceptions.ConnectionError()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            monitoring._artist_statistics(artists_client)
+
+        assert monitoring._TTL_CACHE == {}
+        assert not ttl_cache_file.exists()
+
+        artists_client.get_all_artists.side_effect = None
+        artists_client.get_all_artists.return_value = []
+        assert monitoring._artist_statistics(artists_client) == {
+            "total_artists": 0, "monitored_artists": 0
+        }
+
+
+class TestMonitorQueueAlerts:
+    """Tests for the failed download alert in continuous queue monitoring"""
+
+    @pytest.fixture(autouse=True)
+    def single_poll(self, monkeypatch):
+        class StopAfterFirstPoll:
+            def __init__(self):
+                self.stopped = False
+
+            def is_set(self):
+                return self.stopped
+
+            def set(self):
+                self.stopped = True
+
+            def wait(self, timeout):
+                self.stopped = True
+
+        monkeypatch.setattr(monitoring, "threading",
+                            types.SimpleNamespace(Event=StopAfterFirstPoll))
+
+    def test_alert_counts_and_details(self, capsys):
+        failed = [{"id": i, "status": "failed", "albumId": 1 if i < 2 else i,
+                   "errorMessage": f"error {i}"} for i in range(8)]
+        client = Mock()
+        client.get_queue.return_value = {"totalRecords": 8, "records": failed}
+        client.get_album.side_effect = lambda album_id: {
+            "title": f"Album {album_id}", "artist": {"artistName": "Artist"}
+        }
+
+        monitoring.monitor_queue_continuously(client, interval=0, max_failed=5)
+
+        output = capsys.readouterr().out
+        assert "8 failed downloads (threshold: 5)" in output
+        assert "  ✗ Artist - Album 1: error 0" in output
+        assert "  ✗ Artist - Album 4: error 4" in output
+        assert "error 5" not in output
+        assert "... and 3 more failed items" in output
+
+        # One light queue fetch, and one album lookup per distinct album shown
+        client.get_queue.assert_called_once()
+        assert [c.args[0] for c in client.get_album.call_args_list] == [1, 2, 3, 4]
+
+    def test_album_lookup_failure(self, capsys):
+        client = Mock()
+        client.get_queue.return_value = {
+            "totalRecords": 1,
+            "records": [{"id": 1, "status": "failed", "albumId": 7}]
+        }
+        client.get_album.side_effect = requests.exceptions.HTTPError("404 Client Error")
+
+        monitoring.monitor_queue_continuously(client, interval=0, max_failed=0)
+
+        assert "  ✗ Unknown - Unknown: No error message" in capsys.readouterr().out
+
+
+class TestRequestErrors:
+    """Tests that request failures are reported rather than raised"""
+
+    def test_disk_check_http_error(self):
+        client = Mock()
+        client.get_disk_space.side_effect = requests.exceptions.HTTPError("500 Server Error")
+
+        result = monitoring._check_disk(client)
+
+        assert result["status"] == "warning"
+        assert result["errors"] == ["Failed to check disk space: 500 Server Error"]
+
+    def test_main_reports_connection_error(self, monkeypatch, capsys):
+        def check_recent_history(client, hours):
+            raise requests.exceptions.ConnectionError("connection refused")
+
+        monkeypatch.setattr(monitoring, "setup_client", lambda args: Mock())
+        monkeypatch.setattr(monitoring, "check_recent_history", check_recent_history)
+        monkeypatch.setattr("sys.argv", ["monitoring.py", "history"])
+
+        assert monitoring.main() == 1
+        assert "Error: connection refused" in capsys.readouterr().out
+
+
+class TestSystemStatusCheck:
+    """Tests for merging the concurrent status checks"""
+
+    @staticmethod
+    def status_client(fail=(), disk_used=0.5, failed_in_queue=0):
+        error = requests.exceptions.ConnectionError("connection refused")
+        client = Mock()
+        client.get_system_status.return_value = {"version": "2.0.0"}
+        client.get_disk_space.return_value = [
+            {"path": "/music", "freeSpace": int(100 * (1 - disk_used)), "totalSpace": 100}
+        ]
+        client.get_queue.return_value = {
+            "totalRecords": failed_in_queue,
+            "records": [{"id": i, "status": "failed"} for i in range(failed_in_queue)]
+        }
+        client.get_wanted.return_value = {"totalRecords": 3}
+        for name in fail:
+            getattr(client, name).side_effect = error
+        return client
+
+    @pytest.mark.parametrize("kwargs,expected_status", [
+        ({}, "healthy"),
+        ({"fail": ["get_system_status"]}, "error"),
+        # A failed disk check is reported as an error but only downgrades to warning
+        ({"fail": ["get_disk_space"]}, "warning"),
+        ({"fail": ["get_disk_space", "get_system_status"]}, "error"),
+        ({"fail": ["get_queue"]}, "warning"),
+        ({"fail": ["get_wanted"]}, "warning"),
+        ({"failed_in_queue": 2}, "warning"),
+        ({"disk_used": 0.85}, "warning"),
+        ({"disk_used": 0.95}, "error"),
+        # Error beats warning regardless of which check reports it
+        ({"disk_used": 0.95, "fail": ["get_wanted", "get_queue"]}, "error"),
+        ({"failed_in_queue": 2, "fail": ["get_system_status"]}, "error"),
+    ])
+    def test_status_severity(self, kwargs, expected_status):
+        results = monitoring.system_status_check(self.status_client(**kwargs))
+        assert results["status"] == expected_status
+
+    def test_disk_failure_is_listed_as_error(self):
+        results = monitoring.system_status_check(self.status_client(fail=["get_disk_space"]))
+        assert results["errors"] == ["Failed to check disk space: connection refused"]
+        assert results["warnings"] == []
+
+    def test_verbose_output_order(self, capsys):
+        # Hold the system check until the wanted check has run, so the checks
+        # finish out of order
+        wanted_done = threading.Event()
+        client = self.status_client()
+
+        def get_system_status():
+            assert wanted_done.wait(5)
+            return {"version": "2.0.0"}
+
+        def get_wanted(page, page_size):
+            wanted_done.set()
+            return {"totalRecords": 3}
+
+        client.get_system_status.side_effect = get_system_status
+        client.get_wanted.side_effect = get_wanted
+
+        monitoring.system_status_check(client, verbose=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "✓ Lidarr 2.0.0 is running"
+        assert lines[1].startswith("  Uptime:")
+        assert lines[2].startswith("✓ Disk /music:")
+        assert lines[3].startswith("✓ Queue: 0 total")
+        assert lines[4] == "ℹ Wanted albums: 3"